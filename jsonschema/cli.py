@@ -31,18 +31,24 @@ class _Outputter(object):
     _formatter = attr.ib()
     _stdout = attr.ib()
     _stderr = attr.ib()
+    _opener = attr.ib(default=open)
 
     @classmethod
-    def from_arguments(cls, arguments, stdout, stderr):
+    def from_arguments(cls, arguments, stdout, stderr, opener=open):
         if arguments["output"] == "plain":
             formatter = _PlainFormatter(arguments["error_format"])
         elif arguments["output"] == "pretty":
             formatter = _PrettyFormatter()
-        return cls(formatter=formatter, stdout=stdout, stderr=stderr)
+        return cls(
+            formatter=formatter,
+            stdout=stdout,
+            stderr=stderr,
+            opener=opener,
+        )
 
     def load(self, path):
         try:
-            file = open(path)
+            file = self._opener(path)
         except FileNotFoundError:
             self.filenotfound_error(path=path, exc_info=sys.exc_info())
             raise _CannotLoadFile()
@@ -220,15 +226,24 @@ def _validate_instance(instance_path, instance, validator, outputter):
     return invalid
 
 
-def main(args=sys.argv[1:]):
+def main(args=None):
+    if args is None:
+        args = sys.argv[1:]
     sys.exit(run(arguments=parse_args(args=args)))
 
 
-def run(arguments, stdout=sys.stdout, stderr=sys.stderr, stdin=sys.stdin):
+def run(
+    arguments,
+    stdout=sys.stdout,
+    stderr=sys.stderr,
+    stdin=sys.stdin,
+    opener=open,
+):
     outputter = _Outputter.from_arguments(
         arguments=arguments,
         stdout=stdout,
         stderr=stderr,
+        opener=opener,
     )
 
     try:
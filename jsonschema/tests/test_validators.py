@@ -241,6 +241,31 @@ class TestCreateAndExtend(TestCase):
         Derived = validators.extend(Original)
         self.assertEqual(Derived.ID_OF(Derived.META_SCHEMA), correct_id)
 
+    def test_check_schema_refs_are_not_shared_between_validators(self):
+        """
+        Meta schema refs resolved when checking schemas for one validator
+        aren't reused for another whose meta schema says something else.
+        """
+        Integers = validators.create(
+            meta_schema={
+                "$ref": "#/$defs/schema",
+                "$defs": {"schema": {"type": "integer"}},
+            },
+            validators=validators.Draft202012Validator.VALIDATORS,
+        )
+        Strings = validators.create(
+            meta_schema={
+                "$ref": "#/$defs/schema",
+                "$defs": {"schema": {"type": "string"}},
+            },
+            validators=validators.Draft202012Validator.VALIDATORS,
+        )
+
+        Integers.check_schema(12)
+        Integers.check_schema(37)
+        with self.assertRaises(exceptions.SchemaError):
+            Strings.check_schema(12)
+
 
 class TestValidationErrorMessages(TestCase):
     def message_for(self, instance, schema, *args, **kwargs):
@@ -104,6 +104,18 @@ def _store_schema_list():
     ] + _VOCABULARIES
 
 
+@lru_cache(maxsize=16)
+def _meta_schema_resolver_caches(cls):
+    """
+    Return the ``urljoin`` and remote caches shared by ``cls.check_schema``.
+
+    Every call to `check_schema` still gets its own resolver (and so its own
+    scope stack), but refs within a given meta schema are only resolved once.
+    """
+    resolver = RefResolver.from_schema(cls.META_SCHEMA, id_of=cls.ID_OF)
+    return resolver._urljoin_cache, resolver._remote_cache
+
+
 def create(
     meta_schema,
     validators=(),
@@ -198,7 +210,15 @@ def create(
 
         @classmethod
         def check_schema(cls, schema):
-            for error in cls(cls.META_SCHEMA).iter_errors(schema):
+            urljoin_cache, remote_cache = _meta_schema_resolver_caches(cls)
+            resolver = RefResolver.from_schema(
+                cls.META_SCHEMA,
+                id_of=id_of,
+                urljoin_cache=urljoin_cache,
+                remote_cache=remote_cache,
+            )
+            validator = cls(cls.META_SCHEMA, resolver=resolver)
+            for error in validator.iter_errors(schema):
                 raise exceptions.SchemaError.create_from(error)
 
         def iter_errors(self, instance, _schema=None):